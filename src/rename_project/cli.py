@@ -3,28 +3,50 @@
 from __future__ import annotations
 
 import sys
+from itertools import islice
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import rich_click as click
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 
 from rename_project import __version__
 from rename_project.renamer import (
     RenameResult,
+    apply_plan,
     generate_name_variations,
     get_new_name_from_directory,
     get_old_name_from_pyproject,
     normalize_name,
-    rename_project,
+    plan_rename,
 )
 
 from . import safe_console
 from .safe_console import safe_stream
 from .typed_click import option
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 console = Console(file=safe_stream())
 
+# Longest list printed per section; the rest is summarized in one line
+MAX_LISTED = 50
+
+
+def _print_section(title: str, count: int, lines: Iterable[str]) -> None:
+    """Print a section heading and its first MAX_LISTED lines in one console write.
+
+    Each console.print renders and flushes on its own, which dominates the run
+    time on thousands of changes (especially through a slow pipe).
+    """
+    shown = list(islice(lines, MAX_LISTED))
+    if count > MAX_LISTED:
+        shown.append(f"  ... and {count - MAX_LISTED} more")
+    console.print("\n".join([f"\n[bold]{title} ({count}):[/bold]", *shown]))
+
 
 def display_preview(
     old_name: str,
@@ -56,21 +78,33 @@ def display_preview(
 
     # Show files that would be modified
     if result.files_modified:
-        console.print(f"\n[bold]Files to modify ({len(result.files_modified)}):[/bold]")
-        for path in result.files_modified:
-            console.print(f"  {path}")
+        _print_section(
+            "Files to modify",
+            len(result.files_modified),
+            (f"  {escape(str(path))}" for path in result.files_modified),
+        )
 
     # Show files that would be renamed
     if result.files_renamed:
-        console.print(f"\n[bold]Files to rename ({len(result.files_renamed)}):[/bold]")
-        for old_path, new_path in result.files_renamed:
-            console.print(f"  {old_path.name} -> {new_path.name}")
+        _print_section(
+            "Files to rename",
+            len(result.files_renamed),
+            (
+                f"  {escape(old_path.name)} -> {escape(new_path.name)}"
+                for old_path, new_path in result.files_renamed
+            ),
+        )
 
     # Show directories that would be renamed
     if result.dirs_renamed:
-        console.print(f"\n[bold]Directories to rename ({len(result.dirs_renamed)}):[/bold]")
-        for old_path, new_path in result.dirs_renamed:
-            console.print(f"  {old_path} -> {new_path}")
+        _print_section(
+            "Directories to rename",
+            len(result.dirs_renamed),
+            (
+                f"  {escape(str(old_path))} -> {escape(str(new_path))}"
+                for old_path, new_path in result.dirs_renamed
+            ),
+        )
 
     if not result.files_modified and not result.files_renamed and not result.dirs_renamed:
         console.print("\n[yellow]No changes detected.[/yellow]")
@@ -81,19 +115,31 @@ def display_results(result: RenameResult) -> None:
     console.print("\n[bold green]Rename completed![/bold green]")
 
     if result.files_modified:
-        console.print(f"\n[bold]Files modified ({len(result.files_modified)}):[/bold]")
-        for path in result.files_modified:
-            console.print(f"  [green]✓[/green] {path}")
+        _print_section(
+            "Files modified",
+            len(result.files_modified),
+            (f"  [green]✓[/green] {escape(str(path))}" for path in result.files_modified),
+        )
 
     if result.files_renamed:
-        console.print(f"\n[bold]Files renamed ({len(result.files_renamed)}):[/bold]")
-        for old_path, new_path in result.files_renamed:
-            console.print(f"  [green]✓[/green] {old_path.name} -> {new_path.name}")
+        _print_section(
+            "Files renamed",
+            len(result.files_renamed),
+            (
+                f"  [green]✓[/green] {escape(old_path.name)} -> {escape(new_path.name)}"
+                for old_path, new_path in result.files_renamed
+            ),
+        )
 
     if result.dirs_renamed:
-        console.print(f"\n[bold]Directories renamed ({len(result.dirs_renamed)}):[/bold]")
-        for old_path, new_path in result.dirs_renamed:
-            console.print(f"  [green]✓[/green] {old_path} -> {new_path}")
+        _print_section(
+            "Directories renamed",
+            len(result.dirs_renamed),
+            (
+                f"  [green]✓[/green] {escape(str(old_path))} -> {escape(str(new_path))}"
+                for old_path, new_path in result.dirs_renamed
+            ),
+        )
 
     total = len(result.files_modified) + len(result.files_renamed) + len(result.dirs_renamed)
     console.print(f"\n[bold]Total changes: {total}[/bold]")
@@ -117,7 +163,17 @@ def display_results(result: RenameResult) -> None:
     is_flag=True,
     help="Skip confirmation prompt.",
 )
-def main(*, version: bool, dry_run: bool, yes: bool) -> None:
+@option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=1),
+    default=1,
+    help=(
+        "Number of threads reading and rewriting files (default: 1). More threads only help"
+        " on a cold cache or a network file system."
+    ),
+)
+def main(*, version: bool, dry_run: bool, yes: bool, jobs: int) -> None:
     """Rename a Python project by replacing all occurrences of the old name.
 
     The new project name is derived from the current directory name.
@@ -163,14 +219,15 @@ def main(*, version: bool, dry_run: bool, yes: bool) -> None:
 
     if dry_run:
         console.print("[yellow](Dry run - no changes will be made)[/yellow]")
-        result = rename_project(root, dry_run=True)
-        display_preview(old_name, new_name, result)
-        return
 
-    # Preview changes
-    preview_result = rename_project(root, dry_run=True)
+    # Read the project once; the preview and the rename both use this plan
+    plan = plan_rename(root, old_name=old_name, new_name=new_name, jobs=jobs)
+    preview_result = plan.to_result()
     display_preview(old_name, new_name, preview_result)
 
+    if dry_run:
+        return
+
     total_changes = (
         len(preview_result.files_modified)
         + len(preview_result.files_renamed)
@@ -189,7 +246,7 @@ def main(*, version: bool, dry_run: bool, yes: bool) -> None:
             sys.exit(0)
 
     # Perform the rename
-    result = rename_project(root, dry_run=False)
+    result = apply_plan(plan, jobs=jobs)
     display_results(result)
 
 
@@ -2,44 +2,133 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import importlib
+import mmap
+import os
 import re
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from pathlib import Path  # noqa: TC003 - needed at runtime for dataclass
-from typing import TYPE_CHECKING
+from operator import attrgetter
+from pathlib import Path, PurePath
+from typing import TYPE_CHECKING, Any, AnyStr, NamedTuple, Protocol, cast
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Generator, Iterable, Iterator
+    from collections.abc import Set as AbstractSet
+    from typing import IO, BinaryIO
 
 # Directories to always exclude from processing
-EXCLUDE_DIRS = {".git", ".idea", "__pycache__", ".venv", "venv", ".tox", ".nox", ".mypy_cache"}
+EXCLUDE_DIRS = frozenset(
+    {".git", ".idea", "__pycache__", ".venv", "venv", ".tox", ".nox", ".mypy_cache"}
+)
 
 # Binary file extensions to skip
-BINARY_EXTENSIONS = {
-    ".pyc",
-    ".pyo",
-    ".so",
-    ".dll",
-    ".exe",
-    ".bin",
-    ".jpg",
-    ".jpeg",
-    ".png",
-    ".gif",
-    ".ico",
-    ".pdf",
-    ".zip",
-    ".tar",
-    ".gz",
-    ".bz2",
-    ".xz",
-    ".7z",
-    ".rar",
-    ".whl",
-    ".egg",
-}
+BINARY_EXTENSIONS = frozenset(
+    {
+        ".pyc",
+        ".pyo",
+        ".so",
+        ".dll",
+        ".exe",
+        ".bin",
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".ico",
+        ".pdf",
+        ".zip",
+        ".tar",
+        ".gz",
+        ".bz2",
+        ".xz",
+        ".7z",
+        ".rar",
+        ".whl",
+        ".egg",
+        ".jar",
+        ".class",
+        ".o",
+        ".a",
+        ".wasm",
+        ".db",
+        ".woff",
+        ".woff2",
+        ".mp4",
+    }
+)
 
+# How much of a file is searched for a null byte to detect binary content
+BINARY_SNIFF_SIZE = 8192
 
-@dataclass
+# Files larger than this are rewritten line by line instead of in memory
+LARGE_FILE_SIZE = 1 << 20
+
+
+class _NameMatch(Protocol):
+    def group(self, group: int, /) -> str: ...
+
+
+class _NamePattern(Protocol):
+    """What re.Pattern and google-re2's compiled pattern have in common here."""
+
+    def search(self, string: str, /) -> _NameMatch | None: ...
+
+
+def _compile_linear(pattern: str) -> _NamePattern:
+    """Compile with google-re2 (linear time, no backtracking) if installed, else re.
+
+    Flags must be inline (``(?m)``): re2's compile takes options, not re flags.
+    """
+    try:
+        re2 = importlib.import_module("re2")
+    except ImportError:
+        return re.compile(pattern)
+    return cast("_NamePattern", re2.compile(pattern))
+
+
+def _load_toml_parser() -> Callable[[str], dict[str, Any]] | None:
+    """Return ``tomllib.loads`` on Python 3.11+, None on 3.10 (no stdlib parser)."""
+    try:
+        tomllib = importlib.import_module("tomllib")
+    except ImportError:
+        return None
+    return cast("Callable[[str], dict[str, Any]]", tomllib.loads)
+
+
+_TOML_LOADS = _load_toml_parser()
+
+# ``name = "..."`` in the [project] section, where there is no toml parser.
+# The section body is consumed one whole line at a time and stops at the next
+# line starting with "[", so there is no nested ``.*`` for the engine to
+# backtrack through and the match cannot leak into another section.
+_PROJECT_NAME_RE = _compile_linear(
+    r"(?m)^\[project\][^\n]*\n(?:(?:[^\[\n][^\n]*)?\n)*?[ \t]*name\s*=\s*[\"']([^\"'\n]+)[\"']"
+)
+
+# The platform's path separators, to split path strings in should_exclude_path
+_PATH_SEPARATOR_RE = re.compile("|".join(re.escape(sep) for sep in (os.sep, os.altsep) if sep))
+
+# Position before every capital letter except the first (PascalCase boundaries)
+_PASCAL_BOUNDARY_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+# NameVariations fields in order; an earlier field wins when two variations
+# of an old name are the same string (see create_replacement_map)
+VARIATION_FIELDS = (
+    "lowercase_underscore",
+    "lowercase_hyphen",
+    "uppercase_underscore",
+    "uppercase_hyphen",
+    "pascal_case",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class NameVariations:
     """All naming variations for a project name."""
 
@@ -49,15 +138,23 @@ class NameVariations:
     uppercase_hyphen: str  # MY-PROJECT
     pascal_case: str  # MyProject
 
+    def values(self) -> tuple[str, ...]:
+        """Return the variations in VARIATION_FIELDS order."""
+        return (
+            self.lowercase_underscore,
+            self.lowercase_hyphen,
+            self.uppercase_underscore,
+            self.uppercase_hyphen,
+            self.pascal_case,
+        )
+
+    def items(self) -> Iterator[tuple[str, str]]:
+        """Iterate over (field name, variation) pairs without building a dict."""
+        return zip(VARIATION_FIELDS, self.values(), strict=True)
+
     def as_dict(self) -> dict[str, str]:
         """Return variations as a dictionary."""
-        return {
-            "lowercase_underscore": self.lowercase_underscore,
-            "lowercase_hyphen": self.lowercase_hyphen,
-            "uppercase_underscore": self.uppercase_underscore,
-            "uppercase_hyphen": self.uppercase_hyphen,
-            "pascal_case": self.pascal_case,
-        }
+        return dict(self.items())
 
 
 def _empty_path_list() -> list[Path]:
@@ -68,6 +165,10 @@ def _empty_path_tuple_list() -> list[tuple[Path, Path]]:
     return []
 
 
+def _empty_replacement_map() -> dict[str, str]:
+    return {}
+
+
 @dataclass
 class RenameResult:
     """Result of a rename operation."""
@@ -75,8 +176,47 @@ class RenameResult:
     files_modified: list[Path] = field(default_factory=_empty_path_list)
     files_renamed: list[tuple[Path, Path]] = field(default_factory=_empty_path_tuple_list)
     dirs_renamed: list[tuple[Path, Path]] = field(default_factory=_empty_path_tuple_list)
+    replacements: dict[str, str] = field(default_factory=_empty_replacement_map)
+
+
+def _empty_content_map() -> dict[Path, bytes | None]:
+    return {}
 
 
+def _empty_rename_list() -> list[tuple[Path, Path, bool]]:
+    return []
+
+
+@dataclass
+class RenamePlan:
+    """Changes planned by reading the project once, applied by apply_plan.
+
+    File contents are rewritten in memory while planning, so applying the plan
+    only writes and never reads or substitutes a file a second time. Files
+    larger than LARGE_FILE_SIZE are the exception: they are only checked while
+    planning and rewritten line by line when applied. Paths are the ones found
+    before any rename.
+    """
+
+    # path -> new content (None: large file, streamed when applied), deepest first
+    modifications: dict[Path, bytes | None] = field(default_factory=_empty_content_map)
+    # (old_path, new_path, is_dir), deepest first
+    renames: list[tuple[Path, Path, bool]] = field(default_factory=_empty_rename_list)
+    replacements: dict[str, str] = field(default_factory=_empty_replacement_map)
+    # replacements as compiled while planning, so applying doesn't compile them again
+    replacer: Replacer | None = field(default=None, repr=False, compare=False)
+
+    def to_result(self) -> RenameResult:
+        """Describe the planned changes as a RenameResult."""
+        return RenameResult(
+            files_modified=list(self.modifications),
+            files_renamed=[(old, new) for old, new, is_dir in self.renames if not is_dir],
+            dirs_renamed=[(old, new) for old, new, is_dir in self.renames if is_dir],
+            replacements=self.replacements,
+        )
+
+
+@functools.lru_cache(maxsize=1024)
 def normalize_name(name: str) -> str:
     """Normalize a name to lowercase_underscore format.
 
@@ -84,14 +224,15 @@ def normalize_name(name: str) -> str:
     Also handles PascalCase by inserting underscores before capitals.
     """
     # First, handle PascalCase by inserting underscores before capitals
-    # But only if it's not all caps
-    if not name.isupper() and "_" not in name and "-" not in name:
-        name = re.sub(r"(?<!^)(?=[A-Z])", "_", name)
+    # But only if it's not all caps (and not all lowercase: nothing to insert)
+    if not name.isupper() and not name.islower() and "_" not in name and "-" not in name:
+        name = _PASCAL_BOUNDARY_RE.sub("_", name)
 
     # Replace hyphens with underscores and lowercase
     return name.replace("-", "_").lower()
 
 
+@functools.lru_cache(maxsize=1024)
 def to_pascal_case(name: str) -> str:
     """Convert a name to PascalCase.
 
@@ -100,12 +241,22 @@ def to_pascal_case(name: str) -> str:
         my-project -> MyProject
         foo_bar_baz -> FooBarBaz
     """
-    # Split on underscores or hyphens
-    parts = re.split(r"[_-]", name)
-    # Capitalize first letter of each part
-    return "".join(part.capitalize() for part in parts if part)
-
-
+    # Capitalize the first letter after each underscore or hyphen, lowercase the
+    # rest, and drop the separators - a single scan without splitting into parts
+    chars: list[str] = []
+    capitalize_next = True
+    for char in name:
+        if char in "_-":
+            capitalize_next = True
+        elif capitalize_next:
+            chars.append(char.upper())
+            capitalize_next = False
+        else:
+            chars.append(char.lower())
+    return "".join(chars)
+
+
+@functools.lru_cache(maxsize=1024)
 def generate_name_variations(name: str) -> NameVariations:
     """Generate all naming variations from a base name.
 
@@ -143,19 +294,23 @@ def get_old_name_from_pyproject(path: Path) -> str:
 
     content = pyproject_path.read_text(encoding="utf-8")
 
-    # Simple regex to find name in [project] section
-    # This handles the common case without requiring toml library
-    pattern = r'^\[project\]\s*\n(?:.*\n)*?name\s*=\s*["\']([^"\']+)["\']'
-    match = re.search(pattern, content, re.MULTILINE)
-
-    if not match:
-        # Try alternative: name might be before other fields
-        match = re.search(r'\[project\][\s\S]*?name\s*=\s*["\']([^"\']+)["\']', content)
-
-    if not match:
+    name: object = None
+    if _TOML_LOADS is None:
+        match = _PROJECT_NAME_RE.search(content)
+        if match:
+            name = match.group(1)
+    else:
+        try:
+            project = _TOML_LOADS(content).get("project")
+        except ValueError as e:  # tomllib.TOMLDecodeError
+            raise ValueError(f"Could not parse pyproject.toml: {e}") from e
+        if isinstance(project, dict):
+            name = cast("dict[str, object]", project).get("name")
+
+    if not isinstance(name, str) or not name:
         raise ValueError("Could not find 'name' field in [project] section of pyproject.toml")
 
-    return match.group(1)
+    return name
 
 
 def get_new_name_from_directory(path: Path) -> str:
@@ -178,231 +333,723 @@ def is_binary_file(path: Path) -> bool:
     if path.suffix.lower() in BINARY_EXTENSIONS:
         return True
 
+    # A raw fd read avoids creating a buffered file object for 8 KiB
     try:
-        with path.open("rb") as f:
-            chunk = f.read(8192)
-            return b"\x00" in chunk
-    except (OSError, PermissionError):
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            chunk = os.read(fd, BINARY_SNIFF_SIZE)
+        finally:
+            os.close(fd)
+    except OSError:
         return True
 
+    return b"\x00" in chunk
 
-def should_exclude_path(path: Path, exclude: set[str]) -> bool:
-    """Check if a path should be excluded from processing."""
-    return any(part in exclude for part in path.parts)
 
+def should_exclude_path(path: PurePath | str | Iterable[str], exclude: AbstractSet[str]) -> bool:
+    """Check if a path should be excluded from processing.
 
-def find_files_to_process(root: Path, exclude: set[str]) -> Iterator[Path]:
-    """Find all files to process, excluding specified directories.
-
-    Files are yielded in order from deepest to shallowest.
+    path is a Path, a path string, or its components (e.g. ``(".git", "config")``);
+    strings and components are checked without building a Path.
     """
-    all_files: list[Path] = []
+    if isinstance(path, PurePath):
+        parts: Iterable[str] = path.parts
+    elif isinstance(path, str):
+        parts = _PATH_SEPARATOR_RE.split(path)
+    else:
+        parts = path
+    return not exclude.isdisjoint(parts)
+
+
+def _scandir_tree(path: str, exclude: AbstractSet[str]) -> Iterator[tuple[os.DirEntry[str], int]]:
+    """Yield (entry, depth) for every entry below path, pruning excluded directories.
+
+    depth counts the directories between path and the entry (0 for path's own
+    children). Excluded directories are never entered, and symlinks are never
+    followed. The type checks use the metadata cached on each ``DirEntry`` by
+    the directory read, so they cost no extra ``stat()`` call. Unreadable
+    directories are skipped, like ``os.walk`` does.
+
+    Directories still to be read are kept on an explicit stack, so only one
+    directory handle is open at a time and deep trees cannot hit the
+    recursion limit.
+    """
+    stack = [(path, 0)]
+    while stack:
+        current, depth = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
 
-    for path in root.rglob("*"):
-        if path.is_file() and not should_exclude_path(path.relative_to(root), exclude):
-            all_files.append(path)
+        subdirs: list[tuple[str, int]] = []
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in exclude:
+                        continue
+                    subdirs.append((entry.path, depth + 1))
+                yield entry, depth
+        # Reversed, so directories are read in the order they were listed
+        stack.extend(reversed(subdirs))
+
+
+class WalkEntry(NamedTuple):
+    """A file or directory found by find_entries."""
+
+    path: str
+    name: str
+    is_dir: bool
+    # A regular file; False for directories, symlinks and special files
+    is_file: bool
+    # Directories between root and the entry, for sorting deepest first
+    depth: int
+    # The name ends in one of BINARY_EXTENSIONS, so the content is never read
+    has_binary_extension: bool
+
+
+def find_entries(root: Path, exclude: AbstractSet[str]) -> list[WalkEntry]:
+    """Find all files and directories below root, deepest first.
+
+    This is the only traversal of a run: content planning and rename planning
+    both consume its result. Excluded directories are pruned during the walk,
+    so their subtrees are never entered, and symlinks are never followed.
+    """
+    # The depth comes from the walk and the suffix from the name, so no path
+    # is split or parsed for either
+    splitext = os.path.splitext
+    entries = [
+        WalkEntry(
+            path=entry.path,
+            name=entry.name,
+            is_dir=entry.is_dir(follow_symlinks=False),
+            is_file=entry.is_file(follow_symlinks=False),
+            depth=depth,
+            has_binary_extension=splitext(entry.name)[1].lower() in BINARY_EXTENSIONS,
+        )
+        for entry, depth in _scandir_tree(str(root), exclude)
+    ]
 
     # Sort by depth (deepest first) for bottom-up processing
-    all_files.sort(key=lambda p: len(p.parts), reverse=True)
+    entries.sort(key=attrgetter("depth"), reverse=True)
+    return entries
 
-    yield from all_files
+
+def find_files_to_process(root: Path, exclude: AbstractSet[str]) -> Iterator[Path]:
+    """Find all files to process, excluding specified directories.
+
+    Symlinks are skipped, so no file outside the tree is rewritten through a
+    link. Files are yielded in order from deepest to shallowest.
+    """
+    for entry in find_entries(root, exclude):
+        if entry.is_file:
+            yield Path(entry.path)
 
 
 def find_paths_to_rename(
-    root: Path, old_vars: NameVariations, exclude: set[str]
+    root: Path, old_vars: NameVariations, exclude: AbstractSet[str]
 ) -> list[tuple[Path, Path]]:
     """Find all files and directories that need to be renamed.
 
     Returns list of (old_path, new_path) tuples, sorted deepest first.
     """
-    renames: list[tuple[Path, Path]] = []
-    old_names = [
+    old_names = (
         old_vars.lowercase_underscore,
         old_vars.lowercase_hyphen,
         old_vars.uppercase_underscore,
         old_vars.uppercase_hyphen,
         old_vars.pascal_case,
+    )
+
+    return [
+        (Path(entry.path), Path(entry.path))
+        for entry in find_entries(root, exclude)
+        if any(old_name in entry.name for old_name in old_names)
     ]
 
-    for path in root.rglob("*"):
-        if should_exclude_path(path.relative_to(root), exclude):
-            continue
 
-        name = path.name
-        for old_name in old_names:
-            if old_name in name:
-                renames.append((path, path))
-                break
+def create_replacement_map(old_vars: NameVariations, new_vars: NameVariations) -> dict[str, str]:
+    """Create a mapping of old names to new names for all variations.
 
-    # Sort by depth (deepest first)
-    renames.sort(key=lambda x: len(x[0].parts), reverse=True)
+    Keys are ordered longest first. A single-word old name has fewer distinct
+    variations (``foo`` is both its underscore and its hyphen form); such a
+    key maps to the first variation in field order, so ``foo`` becomes
+    ``new_foo`` rather than ``new-foo``.
+    """
+    pairs = list(zip(old_vars.values(), new_vars.values(), strict=True))
+    # sorted() is stable, so equal keys keep their field order for setdefault
+    replacements: dict[str, str] = {}
+    for old, new in sorted(pairs, key=lambda pair: len(pair[0]), reverse=True):
+        replacements.setdefault(old, new)
+    return replacements
 
-    return renames
 
+class _Automaton(Protocol):
+    """The part of ``ahocorasick.Automaton`` used here (values are (key length, new))."""
 
-def create_replacement_map(old_vars: NameVariations, new_vars: NameVariations) -> dict[str, str]:
-    """Create a mapping of old names to new names for all variations."""
-    return {
-        old_vars.lowercase_underscore: new_vars.lowercase_underscore,
-        old_vars.lowercase_hyphen: new_vars.lowercase_hyphen,
-        old_vars.uppercase_underscore: new_vars.uppercase_underscore,
-        old_vars.uppercase_hyphen: new_vars.uppercase_hyphen,
-        old_vars.pascal_case: new_vars.pascal_case,
-    }
+    def add_word(self, key: str, value: tuple[int, str], /) -> bool: ...
 
+    def make_automaton(self) -> None: ...
 
-def replace_in_file(path: Path, replacements: dict[str, str]) -> bool:
-    """Replace all occurrences in a file.
+    def iter(self, string: str, /) -> Iterator[tuple[int, tuple[int, str]]]: ...
 
-    Args:
-        path: Path to the file
-        replacements: Dict mapping old strings to new strings
 
-    Returns:
-        True if any replacements were made, False otherwise
+def _load_automaton_factory() -> Callable[[], _Automaton] | None:
+    """Return ``ahocorasick.Automaton`` if the optional pyahocorasick is installed."""
+    try:
+        module = importlib.import_module("ahocorasick")
+    except ImportError:
+        return None
+    return cast("Callable[[], _Automaton]", module.Automaton)
+
+
+_AUTOMATON_FACTORY = _load_automaton_factory()
+
+
+def _interacts(key: AnyStr, other: AnyStr) -> bool:
+    """Check if key occurs in, contains, or partly overlaps other."""
+    if key in other or other in key:
+        return True
+    return any(
+        key[-size:] == other[:size] or other[-size:] == key[:size]
+        for size in range(1, min(len(key), len(other)))
+    )
+
+
+def _compile_replace_chain(
+    pairs: list[tuple[AnyStr, AnyStr]],
+) -> Callable[[AnyStr], AnyStr] | None:
+    """Generate a function of hard-coded replace calls, one per (old, new).
+
+    The strings are constants in the generated code, so each call is a plain
+    C-level scan with no dict lookups or per-match callback. Sequential
+    replacement only equals the single-pass result when no key can interact
+    with another key or with a replacement made before it; what can, gets
+    None, and the caller keeps the single-pass scan.
     """
-    if is_binary_file(path):
+    for index, (old, _new) in enumerate(pairs):
+        others = [key for key, _ in pairs[:index] + pairs[index + 1 :]]
+        others += [value for position, (_, value) in enumerate(pairs) if position != index]
+        if any(_interacts(old, other) for other in others):
+            return None
+
+    body = "".join(f"    text = text.replace({old!r}, {new!r})\n" for old, new in pairs)
+    source = f"def replace_chain(text):\n{body}    return text\n"
+    namespace: dict[str, Any] = {}
+    exec(compile(source, "<rename_project replace chain>", "exec"), namespace)
+    return cast("Callable[[AnyStr], AnyStr]", namespace["replace_chain"])
+
+
+@dataclass(frozen=True)
+class Replacer:
+    """Replace every old name variation in a single pass.
+
+    All keys are matched in one scan, leftmost-longest, so text produced by
+    one replacement is never matched again by another. When no key can
+    interact with another key or a replacement (the usual case for project
+    names), a generated chain of str.replace calls gives the same result
+    fastest. Otherwise the scan uses an Aho-Corasick automaton when
+    pyahocorasick is installed (``rename_project[fast]``), or one compiled
+    alternation with the longest keys first; all three agree.
+
+    File content is replaced as UTF-8 bytes by replace_bytes, with the same
+    backends built from the encoded map, so it is never decoded for the
+    chain or the alternation. A UTF-8 key can only match UTF-8 content at a
+    character boundary, so this gives the same result as replacing the text.
+    """
+
+    mapping: dict[str, str]
+    pattern: re.Pattern[str]
+    # UTF-8 encoded keys, to test raw file content before replacing in it
+    needles: tuple[bytes, ...]
+    byte_mapping: dict[bytes, bytes]
+    byte_pattern: re.Pattern[bytes]
+    automaton: _Automaton | None = None
+    chain: Callable[[str], str] | None = None
+    byte_chain: Callable[[bytes], bytes] | None = None
+
+    def __call__(self, text: str) -> str:
+        """Return text with every old name replaced by its new name."""
+        if self.chain is not None:
+            return self.chain(text)
+        if self.automaton is not None:
+            return self._replace_with_automaton(self.automaton, text)
+        lookup = self.mapping.__getitem__
+        return self.pattern.sub(lambda match: lookup(match[0]), text)
+
+    def replace_bytes(self, raw: bytes) -> bytes:
+        """Return UTF-8 content with every old name replaced by its new name."""
+        if self.byte_chain is not None:
+            return self.byte_chain(raw)
+        if self.automaton is not None:
+            # The automaton works on text only
+            return self._replace_with_automaton(self.automaton, raw.decode("utf-8")).encode("utf-8")
+        lookup = self.byte_mapping.__getitem__
+        return self.byte_pattern.sub(lambda match: lookup(match[0]), raw)
+
+    def matches(self, text: str) -> bool:
+        """Check if text contains any old name."""
+        return self.pattern.search(text) is not None
+
+    def may_match(self, raw: bytes) -> bool:
+        """Check if undecoded content contains any old name."""
+        return any(needle in raw for needle in self.needles)
+
+    @staticmethod
+    def _replace_with_automaton(automaton: _Automaton, text: str) -> str:
+        # The automaton reports every (overlapping) hit by end position; order
+        # them by start, longest first, and keep those that don't overlap.
+        # (Automaton.iter_long is meant to do this but drops some hits.)
+        hits = sorted(
+            (end - length + 1, -length, new) for end, (length, new) in automaton.iter(text)
+        )
+        if not hits:
+            return text
+        pieces: list[str] = []
+        position = 0
+        for start, negative_length, new in hits:
+            if start < position:
+                continue
+            pieces.append(text[position:start])
+            pieces.append(new)
+            position = start - negative_length
+        pieces.append(text[position:])
+        return "".join(pieces)
+
+
+def _build_replacer(replacements: dict[str, str] | Replacer) -> Replacer:
+    """Compile a replacement map into a Replacer (no-op if it already is one).
+
+    Compiled maps are cached, so replace_in_file and rename_path called with
+    the same dict over and over compile it only once.
+    """
+    if isinstance(replacements, Replacer):
+        return replacements
+    return _compile_replacer(tuple(replacements.items()))
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_replacer(pairs: tuple[tuple[str, str], ...]) -> Replacer:
+    """Compile (old, new) pairs into a Replacer; see _build_replacer."""
+    replacements = dict(pairs)
+    keys = sorted((key for key in replacements if key), key=len, reverse=True)
+    # An empty alternation would match everywhere; (?!) never matches.
+    pattern = re.compile("|".join(map(re.escape, keys)) if keys else "(?!)")
+    chain = _compile_replace_chain([(key, replacements[key]) for key in keys])
+
+    # The same keys, in the same order, for replacing in undecoded content
+    byte_mapping = {key.encode("utf-8"): replacements[key].encode("utf-8") for key in keys}
+    byte_keys = list(byte_mapping)
+    byte_pattern = re.compile(b"|".join(map(re.escape, byte_keys)) if byte_keys else b"(?!)")
+    byte_chain = _compile_replace_chain(list(byte_mapping.items()))
+    automaton = None
+    if chain is None and _AUTOMATON_FACTORY is not None and keys:
+        automaton = _AUTOMATON_FACTORY()
+        for key in keys:
+            automaton.add_word(key, (len(key), replacements[key]))
+        automaton.make_automaton()
+
+    # Content containing a key also contains every key inside it, so only keys
+    # that contain no shorter key need to be searched for by may_match.
+    needles = tuple(
+        key
+        for key in byte_keys
+        if not any(other in key for other in byte_keys if len(other) < len(key))
+    )
+
+    return Replacer(
+        mapping=replacements,
+        pattern=pattern,
+        needles=needles,
+        byte_mapping=byte_mapping,
+        byte_pattern=byte_pattern,
+        automaton=automaton,
+        chain=chain,
+        byte_chain=byte_chain,
+    )
+
+
+def _is_utf8(raw: bytes) -> bool:
+    """Check if raw is valid UTF-8, without decoding it if it is plain ASCII."""
+    if raw.isascii():
+        return True
+    try:
+        raw.decode("utf-8")
+    except UnicodeDecodeError:
         return False
+    return True
 
+
+def _mapped_prefilter(stream: BinaryIO, replacer: Replacer) -> bool | None:
+    """Search a large file in place for a null byte and for the old names.
+
+    Returns False if the file is binary or contains no old name, True if it
+    may change, or None if it cannot be memory-mapped. The OS pages the file
+    in for the native find calls, so nothing is copied into Python objects.
+    """
     try:
-        content = path.read_text(encoding="utf-8")
-    except (UnicodeDecodeError, OSError):
+        with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if mapped.find(b"\x00", 0, BINARY_SNIFF_SIZE) != -1:
+                return False
+            return any(mapped.find(needle) != -1 for needle in replacer.needles)
+    except (OSError, ValueError):
+        return None
+
+
+def _large_file_changes(stream: BinaryIO, replacer: Replacer) -> bool:
+    """Check line by line if a large file would change, keeping one line in memory."""
+    # Most large files (lock files, generated data) contain no old name at all
+    may_change = _mapped_prefilter(stream, replacer)
+    if may_change is False:
         return False
+    if may_change is None and b"\x00" in stream.read(BINARY_SNIFF_SIZE):
+        return False
+    stream.seek(0)
 
-    original = content
+    changed = False
+    for line in stream:
+        # Check every line: a file that isn't UTF-8 is skipped, as in memory
+        if not _is_utf8(line):
+            return False
+        if not changed and replacer.may_match(line):
+            changed = replacer.replace_bytes(line) != line
+    return changed
 
-    for old, new in replacements.items():
-        content = content.replace(old, new)
 
-    if content != original:
-        path.write_text(content, encoding="utf-8")
-        return True
+def _replaced_content(raw: bytes, replacer: Replacer) -> bytes | None:
+    """Return the new content of a file read as raw, or None if it would not change."""
+    # Most files contain no old name at all; don't look any further at those
+    if not replacer.may_match(raw):
+        return None
+
+    if raw.find(b"\x00", 0, BINARY_SNIFF_SIZE) != -1:
+        return None
+
+    # Content that isn't UTF-8 is left alone, whatever it contains
+    if not _is_utf8(raw):
+        return None
+
+    new_content = replacer.replace_bytes(raw)
+    return new_content if new_content != raw else None
+
+
+def _planned_content(path: Path, replacer: Replacer) -> tuple[bool, bytes | None]:
+    """Return (changed, new_content) for a file.
+
+    Applies the same checks as is_binary_file, but sniffs for a null byte in
+    the content already read, and only in files that contain an old name.
+    new_content is None for a changed file larger than LARGE_FILE_SIZE, which
+    is left to _stream_replace instead of being held in memory. Symlinks are
+    skipped, as in the walk: the atomic rewrite would replace the link itself
+    with a regular file and leave its target unchanged.
+    """
+    if path.suffix.lower() in BINARY_EXTENSIONS or path.is_symlink():
+        return False, None
+    return _scanned_content(path, replacer)
+
+
+def _read_to_end(fd: int, size: int) -> bytes:
+    """Read everything from fd, expecting about size bytes.
+
+    A single os.read may return less than asked (network and FUSE file
+    systems), and the file may have grown since fstat; content rewritten from
+    a short read would lose the rest of the file.
+    """
+    chunks = [os.read(fd, size)]
+    while chunk := os.read(fd, max(size, BINARY_SNIFF_SIZE)):
+        chunks.append(chunk)
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+
+def _scanned_content(path: str | Path, replacer: Replacer) -> tuple[bool, bytes | None]:
+    """Return (changed, new_content) for a file without a binary extension.
+
+    A file is touched once: one open, one fstat and, for all but large files,
+    unbuffered reads of the whole content (normally one, plus one at EOF). No
+    file object is created unless the file is large enough to be scanned line
+    by line.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except OSError:
+        return False, None
 
-    return False
+    try:
+        size = os.fstat(fd).st_size
+        # Empty files (__init__.py, .gitkeep) are common and have nothing to read
+        if size == 0:
+            return False, None
+        if size > LARGE_FILE_SIZE:
+            # The file object takes over the descriptor and closes it
+            stream = os.fdopen(fd, "rb")
+            fd = -1
+            with stream:
+                return _large_file_changes(stream, replacer), None
+        raw = _read_to_end(fd, size)
+    except OSError:
+        return False, None
+    finally:
+        if fd >= 0:
+            os.close(fd)
+
+    new_content = _replaced_content(raw, replacer)
+    return new_content is not None, new_content
+
+
+@contextlib.contextmanager
+def _atomic_writer(path: Path) -> Generator[IO[bytes], None, None]:
+    """Yield a sibling temp file that replaces path once the block completes.
+
+    Readers never see a half-written file, and a failed write leaves path
+    untouched. The temp file takes over path's permission bits.
+    """
+    with tempfile.NamedTemporaryFile(
+        "wb",
+        dir=path.parent,
+        prefix=f".{path.name}.",
+        suffix=".tmp",
+        delete=False,
+    ) as dst:
+        tmp_path = Path(dst.name)
+        try:
+            yield dst
+            dst.close()
+            shutil.copymode(path, tmp_path)
+            tmp_path.replace(path)
+        except BaseException:
+            # The temp file holds the whole new content; never leave it behind
+            dst.close()
+            with contextlib.suppress(OSError):
+                tmp_path.unlink(missing_ok=True)
+            raise
+
+
+def _stream_replace(path: Path, replacer: Replacer) -> None:
+    """Rewrite a file line by line through a sibling temp file.
+
+    Peak memory is one line instead of about three copies of the file.
+    """
+    with _atomic_writer(path) as dst, path.open("rb") as src:
+        for line in src:
+            dst.write(replacer.replace_bytes(line))
 
 
-def rename_path(path: Path, replacements: dict[str, str]) -> Path | None:
+def _write_content(path: Path, new_content: bytes | None, replacer: Replacer) -> None:
+    """Write planned content, or stream the rewrite of a large file (None).
+
+    Planned content is only ever a change, so this never rewrites a file
+    with its own bytes.
+    """
+    if new_content is None:
+        _stream_replace(path, replacer)
+    else:
+        with _atomic_writer(path) as dst:
+            dst.write(new_content)
+
+
+def replace_in_file(path: Path, replacements: dict[str, str] | Replacer) -> bool:
+    """Replace all occurrences in a file.
+
+    Args:
+        path: Path to the file
+        replacements: Dict mapping old strings to new strings, or a Replacer
+            built from one
+
+    Returns:
+        True if any replacements were made, False otherwise
+    """
+    replacer = _build_replacer(replacements)
+    changed, new_content = _planned_content(path, replacer)
+    if not changed:
+        return False
+
+    _write_content(path, new_content, replacer)
+    return True
+
+
+def rename_path(path: Path, replacements: dict[str, str] | Replacer) -> Path | None:
     """Rename a file or directory if its name contains any old name variations.
 
     Args:
         path: Path to rename
-        replacements: Dict mapping old strings to new strings
+        replacements: Dict mapping old strings to new strings, or a Replacer
+            built from one
 
     Returns:
         New path if renamed, None if not renamed
     """
-    name = path.name
-    new_name = name
+    new_name = _renamed_name(path.name, _build_replacer(replacements))
+    if new_name is None:
+        return None
 
-    for old, new in replacements.items():
-        new_name = new_name.replace(old, new)
+    new_path = path.parent / new_name
+    path.rename(new_path)
+    return new_path
 
-    if new_name != name:
-        new_path = path.parent / new_name
-        path.rename(new_path)
-        return new_path
 
-    return None
+def _renamed_name(name: str, replacer: Replacer) -> str | None:
+    """Return the new name for name, or None if it stays the same."""
+    # Most names contain no old name; one search is cheaper than substituting
+    if not replacer.matches(name):
+        return None
 
+    new_name = replacer(name)
+    return new_name if new_name != name else None
 
-def _check_file_for_modifications(file_path: Path, replacements: dict[str, str]) -> bool:
-    """Check if a file would be modified during dry run."""
-    if is_binary_file(file_path):
-        return False
-    try:
-        content = file_path.read_text(encoding="utf-8")
-        return any(old in content for old in replacements)
-    except (UnicodeDecodeError, OSError):
-        return False
 
+def _plan_file_contents(
+    entries: list[WalkEntry], replacer: Replacer, jobs: int
+) -> dict[Path, bytes | None]:
+    """Return the new content of every file that would change, deepest first.
 
-def _process_file_contents(
-    root: Path, exclude: set[str], replacements: dict[str, str], dry_run: bool
-) -> list[Path]:
-    """Process file contents and return list of modified files."""
-    files_modified: list[Path] = []
-    for file_path in find_files_to_process(root, exclude):
-        if dry_run:
-            if _check_file_for_modifications(file_path, replacements):
-                files_modified.append(file_path)
-        elif replace_in_file(file_path, replacements):
-            files_modified.append(file_path)
-    return files_modified
+    The content is None for a large file (see RenamePlan). With ``jobs`` above
+    1, files are read and substituted on that many threads. That only pays off
+    where reads wait on the device (a cold cache, a network file system): on a
+    warm tree the threads contend for the GIL and the run is about twice as
+    slow. The result keeps the order of entries.
+    """
+    # The extension check was done by the walk; those files are never opened.
+    # Files are scanned by their path string, and only changed ones become Paths.
+    files = [entry.path for entry in entries if entry.is_file and not entry.has_binary_extension]
+    plan_file = functools.partial(_scanned_content, replacer=replacer)
 
+    if jobs <= 1 or len(files) <= 1:
+        planned = [plan_file(file_path) for file_path in files]
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            planned = list(executor.map(plan_file, files))
 
-def _rename_paths(
-    root: Path, exclude: set[str], replacements: dict[str, str], dry_run: bool
-) -> tuple[list[tuple[Path, Path]], list[tuple[Path, Path]]]:
-    """Rename files and directories, return (files_renamed, dirs_renamed)."""
-    files_renamed: list[tuple[Path, Path]] = []
-    dirs_renamed: list[tuple[Path, Path]] = []
+    return {
+        Path(file_path): new_content
+        for file_path, (changed, new_content) in zip(files, planned, strict=True)
+        if changed
+    }
 
-    paths_to_check = sorted(root.rglob("*"), key=lambda p: len(p.parts), reverse=True)
 
-    for path in paths_to_check:
-        if should_exclude_path(path.relative_to(root), exclude):
-            continue
+def _plan_renames(entries: list[WalkEntry], replacer: Replacer) -> list[tuple[Path, Path, bool]]:
+    """Return (old_path, new_path, is_dir) for every path to rename, deepest first."""
+    renames: list[tuple[Path, Path, bool]] = []
 
-        name = path.name
-        new_name_computed = name
-        for old, new in replacements.items():
-            new_name_computed = new_name_computed.replace(old, new)
+    for entry in entries:
+        new_name = _renamed_name(entry.name, replacer)
 
-        if new_name_computed != name:
-            new_path = path.parent / new_name_computed
-            if path.is_dir():
-                if not dry_run:
-                    path.rename(new_path)
-                dirs_renamed.append((path, new_path))
-            else:
-                if not dry_run:
-                    path.rename(new_path)
-                files_renamed.append((path, new_path))
+        # Only entries that are renamed become Paths
+        if new_name is not None:
+            path = Path(entry.path)
+            renames.append((path, path.parent / new_name, entry.is_dir))
 
-    return files_renamed, dirs_renamed
+    return renames
 
 
-def rename_project(
+def plan_rename(
     root: Path,
     *,
-    dry_run: bool = False,
     old_name: str | None = None,
     new_name: str | None = None,
-) -> RenameResult:
-    """Rename a project by replacing all name variations.
+    replacements: dict[str, str] | None = None,
+    jobs: int = 1,
+) -> RenamePlan:
+    """Plan a project rename without changing anything on disk.
 
     Args:
         root: Root directory of the project
-        dry_run: If True, don't make any changes
         old_name: Override old name (for testing)
         new_name: Override new name (for testing)
+        replacements: Replacement map to use instead of looking up the names
+        jobs: Number of threads reading files (default: 1, serial)
 
     Returns:
-        RenameResult with lists of modified/renamed files and directories
+        RenamePlan with the new content of every file to modify and every
+        file and directory to rename
     """
     exclude = EXCLUDE_DIRS
 
-    # Get names
-    if old_name is None:
-        old_name = get_old_name_from_pyproject(root)
-    if new_name is None:
-        new_name = get_new_name_from_directory(root)
+    if replacements is None:
+        # Get names
+        if old_name is None:
+            old_name = get_old_name_from_pyproject(root)
+        if new_name is None:
+            new_name = get_new_name_from_directory(root)
+
+        # Generate variations and create replacement map
+        old_vars = generate_name_variations(old_name)
+        new_vars = generate_name_variations(new_name)
+        replacements = create_replacement_map(old_vars, new_vars)
+
+    # Compile the replacement map once, and walk the tree once, for the whole run
+    replacer = _build_replacer(replacements)
+    entries = find_entries(root, exclude)
+
+    return RenamePlan(
+        modifications=_plan_file_contents(entries, replacer, jobs),
+        renames=_plan_renames(entries, replacer),
+        replacements=replacements,
+        replacer=replacer,
+    )
+
 
-    # Generate variations
-    old_vars = generate_name_variations(old_name)
-    new_vars = generate_name_variations(new_name)
+def apply_plan(plan: RenamePlan, *, jobs: int = 1) -> RenameResult:
+    """Write the planned file contents, then rename paths deepest first.
 
-    # Create replacement map
-    replacements = create_replacement_map(old_vars, new_vars)
+    Each write is a temp file, a copymode and a rename, mostly system calls and
+    Python code under the GIL, so threads help about as little as they do for
+    reading (see _plan_file_contents).
 
-    # Process file contents (deepest first)
-    files_modified = _process_file_contents(root, exclude, replacements, dry_run)
+    Args:
+        plan: Plan from plan_rename
+        jobs: Number of threads rewriting files (default: 1, serial)
+
+    Returns:
+        RenameResult with lists of modified/renamed files and directories
+    """
+    replacer = plan.replacer if plan.replacer is not None else _build_replacer(plan.replacements)
+    write = functools.partial(_write_content, replacer=replacer)
 
-    # Rename files and directories (deepest first)
-    files_renamed, dirs_renamed = _rename_paths(root, exclude, replacements, dry_run)
+    if jobs <= 1 or len(plan.modifications) <= 1:
+        for path, new_content in plan.modifications.items():
+            write(path, new_content)
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            # Consuming the results re-raises the first failed write
+            list(executor.map(write, plan.modifications.keys(), plan.modifications.values()))
 
-    return RenameResult(
-        files_modified=files_modified,
-        files_renamed=files_renamed,
-        dirs_renamed=dirs_renamed,
+    # Renames start only once every write has finished, since they move the
+    # files; deepest first, so a parent is renamed after everything inside it
+    # (os.rename, unlike Path.rename, builds no Path to return)
+    rename = os.rename
+    for old_path, new_path, _is_dir in plan.renames:
+        rename(old_path, new_path)
+
+    return plan.to_result()
+
+
+def rename_project(
+    root: Path,
+    *,
+    dry_run: bool = False,
+    old_name: str | None = None,
+    new_name: str | None = None,
+    replacements: dict[str, str] | None = None,
+    jobs: int = 1,
+) -> RenameResult:
+    """Rename a project by replacing all name variations.
+
+    Args:
+        root: Root directory of the project
+        dry_run: If True, don't make any changes
+        old_name: Override old name (for testing)
+        new_name: Override new name (for testing)
+        replacements: Replacement map from an earlier run (e.g. the dry-run
+            preview); when given, the names are not looked up again
+        jobs: Number of threads reading and rewriting files (default: 1, serial)
+
+    Returns:
+        RenameResult with lists of modified/renamed files and directories,
+        and the replacement map that was applied
+    """
+    plan = plan_rename(
+        root, old_name=old_name, new_name=new_name, replacements=replacements, jobs=jobs
     )
+    if dry_run:
+        return plan.to_result()
+    return apply_plan(plan, jobs=jobs)
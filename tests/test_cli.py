@@ -42,6 +42,7 @@ class TestHelpFlag:
         assert "--help" in result.output
         assert "--dry-run" in result.output
         assert "--yes" in result.output
+        assert "--jobs" in result.output
 
     def test_help_short_flag(self, cli_runner: CliRunner) -> None:
         """Test that -h prints help text."""
@@ -117,6 +118,61 @@ class TestDryRun:
         assert not (project_dir / "src" / "new_project").exists()
 
 
+class TestLongLists:
+    """Tests for the truncated listing of large change sets."""
+
+    def test_preview_truncates_long_list(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+        """Test that only the first MAX_LISTED entries of a section are printed."""
+        project_dir = tmp_path / "new_project"
+        project_dir.mkdir()
+        (project_dir / "pyproject.toml").write_text(
+            '[project]\nname = "old_project"\n',
+            encoding="utf-8",
+        )
+        for i in range(60):
+            (project_dir / f"module_{i}.py").write_text("import old_project\n", encoding="utf-8")
+
+        old_cwd = Path.cwd()
+        try:
+            os.chdir(project_dir)
+            result = cli_runner.invoke(main, ["--dry-run"])
+            assert result.exit_code == 0
+            assert "Files to modify (61):" in result.output
+            assert "... and 11 more" in result.output
+        finally:
+            os.chdir(old_cwd)
+
+
+class TestJobsOption:
+    """Tests for the --jobs option."""
+
+    def test_rejects_zero_jobs(self, cli_runner: CliRunner) -> None:
+        """Test that --jobs must be at least 1."""
+        result = cli_runner.invoke(main, ["--jobs", "0"])
+        assert result.exit_code != 0
+        assert "--jobs" in result.output
+
+    def test_serial_run(self, cli_runner: CliRunner, tmp_path: Path) -> None:
+        """Test that --jobs 1 still renames the project."""
+        project_dir = tmp_path / "new_project"
+        project_dir.mkdir()
+        (project_dir / "pyproject.toml").write_text(
+            '[project]\nname = "old_project"\n',
+            encoding="utf-8",
+        )
+
+        old_cwd = Path.cwd()
+        try:
+            os.chdir(project_dir)
+            result = cli_runner.invoke(main, ["--yes", "--jobs", "1"])
+            assert result.exit_code == 0
+        finally:
+            os.chdir(old_cwd)
+
+        content = (project_dir / "pyproject.toml").read_text(encoding="utf-8")
+        assert 'name = "new_project"' in content
+
+
 class TestConfirmation:
     """Tests for confirmation prompt."""
 
@@ -2,26 +2,36 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
+from rename_project import renamer
 from rename_project.renamer import (
     EXCLUDE_DIRS,
     NameVariations,
     RenameResult,
+    apply_plan,
     create_replacement_map,
+    find_entries,
     generate_name_variations,
     get_new_name_from_directory,
     get_old_name_from_pyproject,
     is_binary_file,
     normalize_name,
+    plan_rename,
+    rename_path,
     rename_project,
     replace_in_file,
     should_exclude_path,
     to_pascal_case,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 class TestNormalizeName:
     """Tests for normalize_name function."""
@@ -111,10 +121,27 @@ class TestGenerateNameVariations:
         assert d["uppercase_hyphen"] == "MY-PROJECT"
         assert d["pascal_case"] == "MyProject"
 
+    def test_items_in_field_order(self) -> None:
+        """items() yields (field, variation) pairs in VARIATION_FIELDS order."""
+        vars = generate_name_variations("my_project")
+        items = list(vars.items())
+        assert [field for field, _ in items] == list(renamer.VARIATION_FIELDS)
+        assert items[0] == ("lowercase_underscore", "my_project")
+        assert items[-1] == ("pascal_case", "MyProject")
+
 
 class TestGetOldNameFromPyproject:
     """Tests for get_old_name_from_pyproject function."""
 
+    @pytest.fixture(autouse=True, params=["tomllib", "regex"])
+    def parser(self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+        """Run each test with tomllib and with the regex used on Python 3.10."""
+        if request.param == "regex":
+            monkeypatch.setattr(renamer, "_TOML_LOADS", None)
+        elif renamer._TOML_LOADS is None:  # pyright: ignore[reportPrivateUsage]
+            pytest.skip("tomllib needs Python 3.11+")
+        return request.param
+
     def test_valid_pyproject(self, tmp_path: Path) -> None:
         """Read name from valid pyproject.toml."""
         pyproject = tmp_path / "pyproject.toml"
@@ -154,6 +181,45 @@ class TestGetOldNameFromPyproject:
         )
         assert get_old_name_from_pyproject(tmp_path) == "my-project"
 
+    def test_name_after_multiline_array(self, tmp_path: Path) -> None:
+        """Read name that follows other fields, including a multi-line array."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text(
+            '[project]\nversion = "1.0.0"\nkeywords = [\n    "cli",\n]\nname = "my_project"\n',
+            encoding="utf-8",
+        )
+        assert get_old_name_from_pyproject(tmp_path) == "my_project"
+
+    def test_ignores_name_in_other_section(self, tmp_path: Path) -> None:
+        """A name field in a later section is not mistaken for the project name."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text(
+            '[project]\nversion = "1.0.0"\n\n[tool.other]\nname = "not_it"\n',
+            encoding="utf-8",
+        )
+        with pytest.raises(ValueError, match="Could not find 'name' field"):
+            get_old_name_from_pyproject(tmp_path)
+
+    def test_name_after_multiline_string(self, tmp_path: Path, parser: str) -> None:
+        """A multi-line string holding TOML-like lines does not hide the real name."""
+        if parser == "regex":
+            pytest.skip("the regex does not understand multi-line strings")
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text(
+            '[project]\ndescription = """\nname = "not_it"\n"""\nname = "my_project"\n',
+            encoding="utf-8",
+        )
+        assert get_old_name_from_pyproject(tmp_path) == "my_project"
+
+    def test_invalid_toml(self, tmp_path: Path, parser: str) -> None:
+        """Raise ValueError if pyproject.toml is not valid TOML."""
+        if parser == "regex":
+            pytest.skip("the regex does not validate TOML")
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project\nname = "my_project"\n', encoding="utf-8")
+        with pytest.raises(ValueError, match="Could not parse"):
+            get_old_name_from_pyproject(tmp_path)
+
 
 class TestGetNewNameFromDirectory:
     """Tests for get_new_name_from_directory function."""
@@ -199,6 +265,24 @@ class TestIsBinaryFile:
         f.write_bytes(b"hello\x00world")
         assert is_binary_file(f) is True
 
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """Empty files are not binary."""
+        f = tmp_path / "__init__.py"
+        f.write_bytes(b"")
+        assert is_binary_file(f) is False
+
+    def test_binary_extension_any_case(self, tmp_path: Path) -> None:
+        """The extension check ignores case."""
+        f = tmp_path / "IMAGE.PNG"
+        f.write_bytes(b"data")
+        assert is_binary_file(f) is True
+
+    def test_null_byte_after_sniff_window(self, tmp_path: Path) -> None:
+        """Only the first BINARY_SNIFF_SIZE bytes are searched for a null byte."""
+        f = tmp_path / "test.dat"
+        f.write_bytes(b"a" * renamer.BINARY_SNIFF_SIZE + b"\x00")
+        assert is_binary_file(f) is False
+
 
 class TestShouldExcludePath:
     """Tests for should_exclude_path function."""
@@ -222,6 +306,55 @@ class TestShouldExcludePath:
         assert should_exclude_path(Path("src/module.py"), EXCLUDE_DIRS) is False
         assert should_exclude_path(Path("README.md"), EXCLUDE_DIRS) is False
 
+    def test_path_components(self) -> None:
+        """Path components can be passed without building a Path."""
+        assert should_exclude_path((".git", "config"), EXCLUDE_DIRS) is True
+        assert should_exclude_path(("src", "module.py"), EXCLUDE_DIRS) is False
+
+    def test_path_string(self) -> None:
+        """A path string is split into its components, not its characters."""
+        assert should_exclude_path("src/__pycache__/module.pyc", EXCLUDE_DIRS) is True
+        assert should_exclude_path("src/venv_tools.py", EXCLUDE_DIRS) is False
+        assert should_exclude_path("a", {"a"}) is True
+        assert should_exclude_path("abc", {"a"}) is False
+
+    def test_plain_set(self) -> None:
+        """A mutable set of names works as well."""
+        assert should_exclude_path(Path("build/lib/module.py"), {"build"}) is True
+        assert should_exclude_path(Path("src/builder.py"), {"build"}) is False
+
+
+class TestFindEntries:
+    """Tests for find_entries function."""
+
+    def test_deepest_first_and_pruned(self, tmp_path: Path) -> None:
+        """Entries come deepest first, and excluded directories are not entered."""
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "a" / "b" / "deep.py").write_text("", encoding="utf-8")
+        (tmp_path / "top.py").write_text("", encoding="utf-8")
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "config").write_text("", encoding="utf-8")
+
+        entries = find_entries(tmp_path, EXCLUDE_DIRS)
+
+        assert entries[0].name == "deep.py"
+        assert entries[0].depth == 2
+        assert {entry.name for entry in entries} == {"deep.py", "b", "a", "top.py"}
+        depths = [entry.depth for entry in entries]
+        assert depths == sorted(depths, reverse=True)
+        assert [entry.is_dir for entry in entries if entry.name in {"a", "b"}] == [True, True]
+        assert all(entry.is_file for entry in entries if entry.name.endswith(".py"))
+
+    def test_binary_extension_flag(self, tmp_path: Path) -> None:
+        """Entries record whether the name has a binary extension, in any case."""
+        (tmp_path / "logo.PNG").write_bytes(b"old_project")
+        (tmp_path / "module.py").write_text("", encoding="utf-8")
+        (tmp_path / ".pyc").write_text("", encoding="utf-8")
+
+        flags = {entry.name: entry.has_binary_extension for entry in find_entries(tmp_path, set())}
+
+        assert flags == {"logo.PNG": True, "module.py": False, ".pyc": False}
+
 
 class TestCreateReplacementMap:
     """Tests for create_replacement_map function."""
@@ -238,6 +371,35 @@ class TestCreateReplacementMap:
         assert replacements["OLD-PROJECT"] == "NEW-PROJECT"
         assert replacements["OldProject"] == "NewProject"
 
+    def test_single_word_old_name(self) -> None:
+        """A variation shared by several forms maps to the underscore form."""
+        old_vars = generate_name_variations("foo")
+        new_vars = generate_name_variations("new_foo")
+        replacements = create_replacement_map(old_vars, new_vars)
+
+        assert replacements == {"foo": "new_foo", "FOO": "NEW_FOO", "Foo": "NewFoo"}
+
+    def test_longest_keys_first(self) -> None:
+        """Keys are ordered from longest to shortest."""
+        old_vars = generate_name_variations("my_project")
+        new_vars = generate_name_variations("new")
+        lengths = [len(key) for key in create_replacement_map(old_vars, new_vars)]
+
+        assert lengths == sorted(lengths, reverse=True)
+
+    def test_project_names_use_replace_chain(self) -> None:
+        """A map of project name variations compiles to the str.replace chain."""
+        old_vars = generate_name_variations("old_project")
+        new_vars = generate_name_variations("new_project")
+        replacer = renamer._build_replacer(  # pyright: ignore[reportPrivateUsage]
+            create_replacement_map(old_vars, new_vars)
+        )
+
+        assert replacer.chain is not None
+        assert replacer.byte_chain is not None
+        text = "import old_project  # OldProject, OLD-PROJECT"
+        assert replacer(text) == "import new_project  # NewProject, NEW-PROJECT"
+
 
 class TestReplaceInFile:
     """Tests for replace_in_file function."""
@@ -262,6 +424,150 @@ class TestReplaceInFile:
         assert result is False
         assert f.read_text(encoding="utf-8") == "from other_module import foo"
 
+    def test_preserves_line_endings(self, tmp_path: Path) -> None:
+        """CRLF line endings survive the rewrite."""
+        f = tmp_path / "test.py"
+        f.write_bytes(b"import old_project\r\nold_project.run()\r\n")
+
+        result = replace_in_file(f, {"old_project": "new_project"})
+
+        assert result is True
+        assert f.read_bytes() == b"import new_project\r\nnew_project.run()\r\n"
+
+    def test_no_cascading_replacements(self, tmp_path: Path) -> None:
+        """Text produced by one replacement is not replaced again by another."""
+        f = tmp_path / "test.txt"
+        f.write_text("a b", encoding="utf-8")
+
+        # Applied one after the other, "a" -> "b" -> "c" would turn "a b" into "c c"
+        result = replace_in_file(f, {"a": "b", "b": "c"})
+
+        assert result is True
+        assert f.read_text(encoding="utf-8") == "b c"
+
+    def test_key_containing_shorter_key(self, tmp_path: Path) -> None:
+        """A key that contains a shorter key is still found and replaced."""
+        f = tmp_path / "test.txt"
+        f.write_text("foobar", encoding="utf-8")
+
+        result = replace_in_file(f, {"foo": "x", "foobar": "y"})
+
+        assert result is True
+        assert f.read_text(encoding="utf-8") == "y"
+
+    def test_non_ascii_content(self, tmp_path: Path) -> None:
+        """Replaces names in UTF-8 content that isn't plain ASCII."""
+        f = tmp_path / "test.txt"
+        f.write_text("Grüße von old_project — Olé", encoding="utf-8")
+
+        result = replace_in_file(f, {"old_project": "new_project", "Olé": "Oh"})
+
+        assert result is True
+        assert f.read_text(encoding="utf-8") == "Grüße von new_project — Oh"
+
+    def test_skips_non_utf8_content(self, tmp_path: Path) -> None:
+        """Leaves files that aren't valid UTF-8 untouched."""
+        f = tmp_path / "test.txt"
+        f.write_bytes(b"caf\xe9 old_project")
+
+        result = replace_in_file(f, {"old_project": "new_project"})
+
+        assert result is False
+        assert f.read_bytes() == b"caf\xe9 old_project"
+
+    def test_reuses_compiled_map(self) -> None:
+        """Repeated calls with the same map compile it only once."""
+        build_replacer = renamer._build_replacer  # pyright: ignore[reportPrivateUsage]
+        replacements = {"old_project": "new_project", "OldProject": "NewProject"}
+
+        assert build_replacer(replacements) is build_replacer(dict(replacements))
+        assert build_replacer(replacements) is not build_replacer({"old_project": "other"})
+
+    def test_atomic_rewrite(self, tmp_path: Path) -> None:
+        """The rewritten file keeps its permissions; no temp file is left."""
+        f = tmp_path / "run.sh"
+        f.write_text("old_project --run\n", encoding="utf-8")
+        f.chmod(0o755)
+        mode = f.stat().st_mode
+
+        result = replace_in_file(f, {"old_project": "new_project"})
+
+        assert result is True
+        assert f.read_text(encoding="utf-8") == "new_project --run\n"
+        assert f.stat().st_mode == mode
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["run.sh"]
+
+    def test_short_reads(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A read returning less than asked does not truncate the rewritten file."""
+        f = tmp_path / "test.py"
+        content = "import old_project\n" + "print('rest of the file')\n" * 5
+        f.write_text(content, encoding="utf-8")
+        read = os.read
+
+        def short_read(fd: int, size: int) -> bytes:
+            return read(fd, min(size, 7))
+
+        monkeypatch.setattr(os, "read", short_read)
+        result = replace_in_file(f, {"old_project": "new_project"})
+        monkeypatch.undo()
+
+        assert result is True
+        assert f.read_text(encoding="utf-8") == content.replace("old_project", "new_project")
+
+    def test_failed_replace_leaves_no_temp_file(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """If the temp file cannot replace the original, it is removed."""
+        f = tmp_path / "test.py"
+        f.write_text("import old_project\n", encoding="utf-8")
+
+        def locked(_self: Path, _target: Path) -> Path:
+            raise PermissionError("file is in use")
+
+        monkeypatch.setattr(Path, "replace", locked)
+        with pytest.raises(PermissionError):
+            replace_in_file(f, {"old_project": "new_project"})
+
+        assert f.read_text(encoding="utf-8") == "import old_project\n"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["test.py"]
+
+    def test_file_removed_after_planning(self, tmp_path: Path) -> None:
+        """A planned file deleted before applying leaves no temp file."""
+        f = tmp_path / "a.py"
+        f.write_text("import old_project\n", encoding="utf-8")
+        plan = plan_rename(tmp_path, old_name="old_project", new_name="new_project")
+        f.unlink()
+
+        # shutil.copymode cannot read the mode of the missing original
+        with pytest.raises(FileNotFoundError):
+            apply_plan(plan, jobs=1)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_skips_symlink(self, tmp_path: Path) -> None:
+        """A symlink is neither replaced by a file nor rewritten through."""
+        target = tmp_path / "target.py"
+        target.write_text("import old_project\n", encoding="utf-8")
+        link = tmp_path / "link.py"
+        try:
+            link.symlink_to(target)
+        except OSError:
+            pytest.skip("symlinks not supported")
+
+        result = replace_in_file(link, {"old_project": "new_project"})
+
+        assert result is False
+        assert link.is_symlink()
+        assert target.read_text(encoding="utf-8") == "import old_project\n"
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        """An empty file is reported unchanged."""
+        f = tmp_path / "__init__.py"
+        f.write_bytes(b"")
+
+        assert replace_in_file(f, {"old_project": "new_project"}) is False
+        assert f.read_bytes() == b""
+
     def test_skips_binary(self, tmp_path: Path) -> None:
         """Skips binary files."""
         f = tmp_path / "test.pyc"
@@ -271,6 +577,16 @@ class TestReplaceInFile:
 
         assert result is False
 
+    def test_skips_null_byte_content(self, tmp_path: Path) -> None:
+        """Skips files whose content is binary, whatever their extension."""
+        f = tmp_path / "test.dat"
+        f.write_bytes(b"old_project\x00data")
+
+        result = replace_in_file(f, {"old_project": "new_project"})
+
+        assert result is False
+        assert f.read_bytes() == b"old_project\x00data"
+
     def test_multiple_variations(self, tmp_path: Path) -> None:
         """Replaces multiple variations."""
         f = tmp_path / "test.py"
@@ -293,6 +609,121 @@ class TestReplaceInFile:
         assert "new-project" in content
 
 
+class TestLargeFiles:
+    """Files above LARGE_FILE_SIZE are rewritten line by line."""
+
+    @pytest.fixture(autouse=True)
+    def small_limit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Treat every file longer than 16 bytes as large."""
+        monkeypatch.setattr(renamer, "LARGE_FILE_SIZE", 16)
+
+    def test_streams_rewrite(self, tmp_path: Path) -> None:
+        """Content, line endings and permissions survive; no temp file is left."""
+        f = tmp_path / "run.sh"
+        f.write_bytes(b"#!/bin/sh\r\nold_project --run\r\necho done\r\n")
+        f.chmod(0o755)
+        mode = f.stat().st_mode
+
+        result = replace_in_file(f, {"old_project": "new_project"})
+
+        assert result is True
+        assert f.read_bytes() == b"#!/bin/sh\r\nnew_project --run\r\necho done\r\n"
+        assert f.stat().st_mode == mode
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["run.sh"]
+
+    def test_no_match_is_untouched(self, tmp_path: Path) -> None:
+        """A large file without an old name is reported unchanged."""
+        f = tmp_path / "data.txt"
+        f.write_text("nothing to see here\n" * 10, encoding="utf-8")
+
+        assert replace_in_file(f, {"old_project": "new_project"}) is False
+
+    def test_skips_binary_content(self, tmp_path: Path) -> None:
+        """A large file with a null byte near the start is left alone."""
+        f = tmp_path / "data.dat"
+        content = b"\x00header\n" + b"old_project\n" * 10
+        f.write_bytes(content)
+
+        assert replace_in_file(f, {"old_project": "new_project"}) is False
+        assert f.read_bytes() == content
+
+    def test_plan_defers_content(self, tmp_path: Path) -> None:
+        """The plan does not hold the new content of a large file."""
+        f = tmp_path / "big.txt"
+        f.write_text("line\n" * 10 + "old_project\n", encoding="utf-8")
+
+        plan = plan_rename(tmp_path, old_name="old_project", new_name="new_project")
+        assert plan.modifications == {f: None}
+
+        apply_plan(plan)
+        assert f.read_text(encoding="utf-8") == "line\n" * 10 + "new_project\n"
+
+
+class TestRenamePath:
+    """Tests for rename_path function."""
+
+    def test_renames_matching_name(self, tmp_path: Path) -> None:
+        """A name containing an old name is renamed in place."""
+        f = tmp_path / "old_project_utils.py"
+        f.write_text("", encoding="utf-8")
+
+        new_path = rename_path(f, {"old_project": "new_project"})
+
+        assert new_path == tmp_path / "new_project_utils.py"
+        assert (tmp_path / "new_project_utils.py").exists()
+        assert not f.exists()
+
+    def test_skips_other_names(self, tmp_path: Path) -> None:
+        """A name without an old name is left alone."""
+        f = tmp_path / "README.md"
+        f.write_text("", encoding="utf-8")
+
+        assert rename_path(f, {"old_project": "new_project"}) is None
+        assert f.exists()
+
+    def test_replaces_every_variation_in_a_name(self, tmp_path: Path) -> None:
+        """Different variations in one name are all replaced, in one pass."""
+        f = tmp_path / "old_project-to-OldProject.txt"
+        f.write_text("", encoding="utf-8")
+        replacements = create_replacement_map(
+            generate_name_variations("old_project"), generate_name_variations("new_project")
+        )
+
+        new_path = rename_path(f, replacements)
+
+        assert new_path == tmp_path / "new_project-to-NewProject.txt"
+
+
+class TestOverlappingReplacements:
+    """Both scan backends resolve overlapping keys leftmost-longest."""
+
+    @pytest.fixture(params=["regex", "automaton"])
+    def backend(
+        self, request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+    ) -> Iterator[None]:
+        """Run the test once with the regex, once with the Aho-Corasick automaton."""
+        if request.param == "regex":
+            monkeypatch.setattr(renamer, "_AUTOMATON_FACTORY", None)
+        elif renamer._AUTOMATON_FACTORY is None:  # pyright: ignore[reportPrivateUsage]
+            pytest.skip("pyahocorasick not installed")
+        # Maps compiled under one backend must not be reused under the other
+        compile_replacer = renamer._compile_replacer  # pyright: ignore[reportPrivateUsage]
+        compile_replacer.cache_clear()
+        yield
+        compile_replacer.cache_clear()
+
+    @pytest.mark.usefixtures("backend")
+    def test_leftmost_longest(self, tmp_path: Path) -> None:
+        """The leftmost match wins, and the longest key at that position."""
+        f = tmp_path / "test.txt"
+        f.write_text("abcbc ab bca", encoding="utf-8")
+
+        result = replace_in_file(f, {"ab": "X", "abc": "Y", "bc": "Z", "ca": "W"})
+
+        assert result is True
+        assert f.read_text(encoding="utf-8") == "YZ X Za"
+
+
 class TestRenameProject:
     """Tests for the rename_project function."""
 
@@ -363,6 +794,20 @@ class TestRenameProject:
         assert len(result.dirs_renamed) == 1
         assert len(result.files_renamed) == 1
 
+    def test_renames_nested_directories(self, tmp_path: Path) -> None:
+        """Directories inside renamed directories are renamed too, bottom-up."""
+        deep = tmp_path / "old_project" / "old_project" / "old_project"
+        deep.mkdir(parents=True)
+        (deep / "old_project.py").write_text("", encoding="utf-8")
+
+        result = rename_project(tmp_path, old_name="old_project", new_name="new_project")
+
+        new_deep = tmp_path / "new_project" / "new_project" / "new_project"
+        assert (new_deep / "new_project.py").exists()
+        assert not (tmp_path / "old_project").exists()
+        assert len(result.dirs_renamed) == 3
+        assert len(result.files_renamed) == 1
+
     def test_excludes_git_directory(self, tmp_path: Path) -> None:
         """Does not process .git directory."""
         # Create project structure
@@ -388,6 +833,83 @@ class TestRenameProject:
         for path in result.files_modified:
             assert ".git" not in str(path)
 
+    def test_reuses_preview_replacements(self, tmp_path: Path) -> None:
+        """The replacement map from a dry run can drive the real run."""
+        (tmp_path / "pyproject.toml").write_text(
+            '[project]\nname = "old_project"\n',
+            encoding="utf-8",
+        )
+
+        preview = rename_project(
+            tmp_path,
+            dry_run=True,
+            old_name="old_project",
+            new_name="new_project",
+        )
+        assert preview.replacements["old_project"] == "new_project"
+
+        # No names given: the pyproject/directory lookup must not run again
+        result = rename_project(tmp_path, dry_run=False, replacements=preview.replacements)
+
+        assert result.files_modified == preview.files_modified
+        content = (tmp_path / "pyproject.toml").read_text(encoding="utf-8")
+        assert 'name = "new_project"' in content
+
+    def test_thread_count_does_not_change_result(self, tmp_path: Path) -> None:
+        """Serial and threaded runs plan the same changes in the same order."""
+        for index in range(20):
+            package = tmp_path / f"pkg{index % 3}" / "sub"
+            package.mkdir(parents=True, exist_ok=True)
+            (package / f"mod{index}.py").write_text(
+                "import old_project" if index % 2 else "import other",
+                encoding="utf-8",
+            )
+
+        serial = rename_project(
+            tmp_path, dry_run=True, old_name="old_project", new_name="new_project", jobs=1
+        )
+        threaded = rename_project(
+            tmp_path, dry_run=True, old_name="old_project", new_name="new_project", jobs=4
+        )
+
+        assert len(serial.files_modified) == 10
+        assert threaded.files_modified == serial.files_modified
+
+    def test_threaded_apply_rewrites_every_file(self, tmp_path: Path) -> None:
+        """A threaded apply writes every planned file before renaming."""
+        package = tmp_path / "old_project"
+        package.mkdir()
+        for index in range(10):
+            (package / f"mod{index}.py").write_text("import old_project", encoding="utf-8")
+
+        plan = plan_rename(tmp_path, old_name="old_project", new_name="new_project")
+        apply_plan(plan, jobs=4)
+
+        for index in range(10):
+            content = (tmp_path / "new_project" / f"mod{index}.py").read_text(encoding="utf-8")
+            assert content == "import new_project"
+
+    def test_does_not_rewrite_through_symlinks(self, tmp_path: Path) -> None:
+        """Files outside the tree are not rewritten through a symlink."""
+        outside = tmp_path / "outside.txt"
+        outside.write_text("old_project", encoding="utf-8")
+        project = tmp_path / "project"
+        project.mkdir()
+        try:
+            (project / "link.txt").symlink_to(outside)
+        except OSError:
+            pytest.skip("symlinks not supported")
+
+        result = rename_project(
+            project,
+            dry_run=False,
+            old_name="old_project",
+            new_name="new_project",
+        )
+
+        assert outside.read_text(encoding="utf-8") == "old_project"
+        assert result.files_modified == []
+
     def test_updates_pyproject_toml(self, tmp_path: Path) -> None:
         """Updates name in pyproject.toml."""
         (tmp_path / "pyproject.toml").write_text(
@@ -406,6 +928,47 @@ class TestRenameProject:
         assert 'name = "new_project"' in content
 
 
+class TestPlanRename:
+    """Tests for plan_rename and apply_plan."""
+
+    def test_plan_then_apply(self, tmp_path: Path) -> None:
+        """Planning changes nothing on disk; applying writes the planned changes."""
+        src = tmp_path / "src" / "old_project"
+        src.mkdir(parents=True)
+        init = src / "__init__.py"
+        init.write_text("from old_project import OldProject", encoding="utf-8")
+
+        plan = plan_rename(tmp_path, old_name="old_project", new_name="new_project")
+
+        assert plan.modifications == {init: b"from new_project import NewProject"}
+        assert plan.renames == [(src, tmp_path / "src" / "new_project", True)]
+        assert init.read_text(encoding="utf-8") == "from old_project import OldProject"
+
+        result = apply_plan(plan)
+
+        new_init = tmp_path / "src" / "new_project" / "__init__.py"
+        assert new_init.read_text(encoding="utf-8") == "from new_project import NewProject"
+        assert result.files_modified == [init]
+        assert result.dirs_renamed == [(src, tmp_path / "src" / "new_project")]
+
+    def test_apply_reuses_compiled_replacements(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Applying a plan does not compile the replacement map again."""
+        big = tmp_path / "big.txt"
+        big.write_text("line\n" * 10 + "old_project\n", encoding="utf-8")
+        monkeypatch.setattr(renamer, "LARGE_FILE_SIZE", 16)
+        plan = plan_rename(tmp_path, old_name="old_project", new_name="new_project")
+
+        def fail(_replacements: object) -> None:
+            raise AssertionError("replacement map compiled twice")
+
+        monkeypatch.setattr(renamer, "_build_replacer", fail)
+        apply_plan(plan)
+
+        assert big.read_text(encoding="utf-8").endswith("new_project\n")
+
+
 class TestNameVariationsDataclass:
     """Tests for NameVariations dataclass."""
 
@@ -431,3 +994,4 @@ class TestRenameResultDataclass:
         assert result.files_modified == []
         assert result.files_renamed == []
         assert result.dirs_renamed == []
+        assert result.replacements == {}